@@ -129,15 +129,25 @@ CREATE TABLE IF NOT EXISTS audit_log (
 );
 
 -- Create indexes for performance
-CREATE INDEX IF NOT EXISTS idx_requests_status ON requests(status);
+-- Listings filtered by status are ordered by start time; the composite index serves both
+DROP INDEX IF EXISTS idx_requests_status;
+CREATE INDEX IF NOT EXISTS idx_requests_status_start ON requests(status, start_timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_requests_request_id ON requests(request_id);
 CREATE INDEX IF NOT EXISTS idx_requests_timestamps ON requests(start_timestamp, end_timestamp);
 CREATE INDEX IF NOT EXISTS idx_requests_date ON requests(requested_date);
+-- Range index for overlap (conflict) queries; only active bookings can conflict
+CREATE INDEX IF NOT EXISTS idx_requests_active_time_range ON requests
+    USING GIST (tstzrange(start_timestamp, end_timestamp, '[)'))
+    WHERE status IN ('approved', 'pending');
 CREATE INDEX IF NOT EXISTS idx_request_resources_request ON request_resources(request_id);
 CREATE INDEX IF NOT EXISTS idx_request_resources_resource ON request_resources(resource_id);
 CREATE INDEX IF NOT EXISTS idx_approvals_request ON approvals(request_id);
-CREATE INDEX IF NOT EXISTS idx_audit_log_request ON audit_log(request_id);
+-- Audit trail per request is read newest-first; the composite index serves the filter and the sort
+DROP INDEX IF EXISTS idx_audit_log_request;
+CREATE INDEX IF NOT EXISTS idx_audit_log_request_timestamp ON audit_log(request_id, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_audit_log_timestamp ON audit_log(timestamp);
+-- Audit queries filtered by action (e.g., all override approvals) read newest-first
+CREATE INDEX IF NOT EXISTS idx_audit_log_action_timestamp ON audit_log(action, timestamp DESC);
 CREATE INDEX IF NOT EXISTS idx_resources_active ON resources(is_active);
 
 -- Add trigger to update updated_at timestamp
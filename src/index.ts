@@ -12,17 +12,20 @@ dotenv.config();
 
 const app = express();
 const PORT = process.env.PORT || 3000;
+const LOG_REQUESTS = process.env.LOG_REQUESTS !== 'false';
 
 // Middleware
 app.use(cors());
 app.use(express.json());
 app.use(express.urlencoded({ extended: true }));
 
-// Request logging middleware
-app.use((req, res, next) => {
-  console.log(`${new Date().toISOString()} - ${req.method} ${req.path}`);
-  next();
-});
+// Request logging middleware (skipped entirely when disabled)
+if (LOG_REQUESTS) {
+  app.use((req, res, next) => {
+    console.log(`${new Date().toISOString()} - ${req.method} ${req.path}`);
+    next();
+  });
+}
 
 // Health check endpoint
 app.get('/health', async (req, res) => {
@@ -3,11 +3,13 @@ import { Request, Response, NextFunction } from 'express';
 // Simple authentication middleware (placeholder)
 // In production, implement proper JWT or session-based authentication
 
+export type UserRole = 'admin' | 'ro' | 'requester';
+
 export interface AuthenticatedRequest extends Request {
   user?: {
     id: string;
     username: string;
-    role: 'admin' | 'ro' | 'requester';
+    role: UserRole;
   };
 }
 
@@ -21,7 +23,7 @@ export function authenticate(
   // TODO: Implement actual authentication
   // For now, extract from headers as placeholder
   const username = req.headers['x-user'] as string || 'anonymous';
-  const role = (req.headers['x-role'] as string || 'admin') as 'admin' | 'ro' | 'requester';
+  const role = (req.headers['x-role'] as string || 'admin') as UserRole;
   
   (req as AuthenticatedRequest).user = {
     id: username,
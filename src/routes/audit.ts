@@ -32,7 +32,12 @@ router.get('/', async (req: Request, res: Response) => {
 router.get('/:request_id', async (req: Request, res: Response) => {
   try {
     const requestId = parseInt(req.params.request_id);
-    const trail = await auditService.getAuditTrail(requestId);
+    const filters = {
+      from_date: req.query.from_date ? new Date(req.query.from_date as string) : undefined,
+      to_date: req.query.to_date ? new Date(req.query.to_date as string) : undefined
+    };
+    
+    const trail = await auditService.getAuditTrail(requestId, filters);
     
     res.json({
       success: true,
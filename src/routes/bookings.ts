@@ -92,6 +92,52 @@ router.get('/', async (req: Request, res: Response) => {
   }
 });
 
+// GET /api/bookings/stats - Count bookings per status
+router.get('/stats', async (req: Request, res: Response) => {
+  try {
+    const counts = await bookingService.getBookingStatusCounts();
+    
+    res.json({
+      success: true,
+      data: counts
+    });
+  } catch (error: any) {
+    console.error('Error getting booking stats:', error);
+    res.status(500).json({ error: error.message || 'Failed to get booking stats' });
+  }
+});
+
+// GET /api/bookings/overlaps - Find all overlapping bookings in a date window
+router.get('/overlaps', async (req: Request, res: Response) => {
+  try {
+    if (!req.query.from_date || !req.query.to_date) {
+      return res.status(400).json({ error: 'from_date and to_date are required' });
+    }
+    
+    const fromDate = new Date(req.query.from_date as string);
+    const toDate = new Date(req.query.to_date as string);
+    
+    if (isNaN(fromDate.getTime()) || isNaN(toDate.getTime())) {
+      return res.status(400).json({ error: 'from_date and to_date must be valid dates' });
+    }
+    
+    if (fromDate.getTime() > toDate.getTime()) {
+      return res.status(400).json({ error: 'from_date must not be after to_date' });
+    }
+    
+    const overlaps = await bookingService.findOverlappingBookings(fromDate, toDate);
+    
+    res.json({
+      success: true,
+      data: overlaps,
+      count: overlaps.length
+    });
+  } catch (error: any) {
+    console.error('Error finding overlapping bookings:', error);
+    res.status(500).json({ error: error.message || 'Failed to find overlapping bookings' });
+  }
+});
+
 // GET /api/bookings/:id - Get booking by ID or request_id
 router.get('/:id', async (req: Request, res: Response) => {
   try {
@@ -2,18 +2,34 @@ import type { AuditLogEntry } from '../types/index.js';
 import type { PoolClient } from 'pg';
 import pool from '../db/connection.js';
 
+export type AuditLogInput = Omit<AuditLogEntry, 'id' | 'timestamp'>;
+
+const AUDIT_COLUMNS_PER_ROW = 9;
+
 // Log an audit entry
 export async function logAudit(
-  entry: Omit<AuditLogEntry, 'id' | 'timestamp'>,
+  entry: AuditLogInput,
+  client?: PoolClient
+): Promise<void> {
+  await logAuditBatch([entry], client);
+}
+
+// Log several audit entries with a single multi-row INSERT
+export async function logAuditBatch(
+  entries: AuditLogInput[],
   client?: PoolClient
 ): Promise<void> {
+  if (entries.length === 0) {
+    return;
+  }
+  
   const db = client || pool;
+  const values: any[] = [];
+  const rows: string[] = [];
   
-  await db.query(
-    `INSERT INTO audit_log (
-      request_id, action, actor, old_status, new_status, reason, metadata, ip_address, user_agent
-    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)`,
-    [
+  for (const entry of entries) {
+    const base = values.length;
+    values.push(
       entry.request_id || null,
       entry.action,
       entry.actor,
@@ -23,17 +39,50 @@ export async function logAudit(
       entry.metadata ? JSON.stringify(entry.metadata) : null,
       entry.ip_address || null,
       entry.user_agent || null
-    ]
+    );
+    
+    const placeholders: string[] = [];
+    for (let i = 1; i <= AUDIT_COLUMNS_PER_ROW; i++) {
+      placeholders.push(`$${base + i}`);
+    }
+    rows.push(`(${placeholders.join(', ')})`);
+  }
+  
+  await db.query(
+    `INSERT INTO audit_log (
+      request_id, action, actor, old_status, new_status, reason, metadata, ip_address, user_agent
+    ) VALUES ${rows.join(', ')}`,
+    values
   );
 }
 
 // Get audit trail for a specific request
-export async function getAuditTrail(requestId: number): Promise<AuditLogEntry[]> {
-  const result = await pool.query(
-    `SELECT * FROM audit_log WHERE request_id = $1 ORDER BY timestamp DESC`,
-    [requestId]
-  );
+// Date bounds become a range scan on idx_audit_log_request_timestamp
+export async function getAuditTrail(
+  requestId: number,
+  filters?: {
+    from_date?: Date;
+    to_date?: Date;
+  }
+): Promise<AuditLogEntry[]> {
+  let query = 'SELECT * FROM audit_log WHERE request_id = $1';
+  const params: any[] = [requestId];
+  let paramIndex = 2;
+  
+  if (filters?.from_date) {
+    query += ` AND timestamp >= $${paramIndex}`;
+    params.push(filters.from_date);
+    paramIndex++;
+  }
   
+  if (filters?.to_date) {
+    query += ` AND timestamp <= $${paramIndex}`;
+    params.push(filters.to_date);
+  }
+  
+  query += ' ORDER BY timestamp DESC';
+  
+  const result = await pool.query(query, params);
   return result.rows;
 }
 
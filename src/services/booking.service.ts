@@ -5,22 +5,29 @@ import type {
   BookingDetail,
   ConflictInfo,
   ConflictCheckResult,
+  BookingOverlap,
+  BookingStatus,
   ApprovalActionInput,
   RescheduleInput,
   TimeSlotSuggestion,
   Resource
 } from '../types/index.js';
-import { v4 as uuidv4 } from 'uuid';
-import { parseTime, combineDateTime } from '../utils/time.js';
-import { logAudit } from './audit.service.js';
+import { randomBytes } from 'crypto';
+import { combineDateTime, combineDateTimeRange } from '../utils/time.js';
+import { findOverlaps } from '../utils/intervals.js';
+import type { Interval } from '../utils/intervals.js';
+import { logAudit, logAuditBatch } from './audit.service.js';
+import type { AuditLogInput } from './audit.service.js';
 import * as calendarService from './calendar.service.js';
 
-// Generate unique request ID
+// Configured local timezone (read once; dotenv is loaded by the connection module)
+const TIMEZONE = process.env.TIMEZONE || 'America/New_York';
+
+// Generate unique request ID (8 random hex characters, same as the first UUID group)
 function generateRequestId(): string {
-  const date = new Date();
-  const year = date.getFullYear();
-  const uuid = uuidv4().split('-')[0].toUpperCase();
-  return `REQ-${year}-${uuid}`;
+  const year = new Date().getFullYear();
+  const suffix = randomBytes(4).toString('hex').toUpperCase();
+  return `REQ-${year}-${suffix}`;
 }
 
 // Check if RO is whitelisted (placeholder - would check against whitelist table)
@@ -37,13 +44,19 @@ export async function createBookingRequest(
   const requestId = generateRequestId();
   const roWhitelisted = await isRoWhitelisted(data.ro_name);
   
+  // Normalize resource IDs once (JSON bodies may carry strings or repeats)
+  const resourceIds = [...new Set(data.resource_ids.map(Number))];
+  
   // Parse time and combine with date in configured timezone
-  const timezone = process.env.TIMEZONE || 'America/New_York';
-  const startTimestamp = combineDateTime(data.requested_date, data.start_time, timezone);
-  const endTimestamp = combineDateTime(data.requested_date, data.end_time, timezone);
+  const { start: startTimestamp, end: endTimestamp } = combineDateTimeRange(
+    data.requested_date,
+    data.start_time,
+    data.end_time,
+    TIMEZONE
+  );
   
-  // Validate time range
-  if (endTimestamp <= startTimestamp) {
+  // Validate time range (numeric compare, avoids Date-to-primitive coercion)
+  if (endTimestamp.getTime() <= startTimestamp.getTime()) {
     throw new Error('End time must be after start time');
   }
   
@@ -91,22 +104,21 @@ export async function createBookingRequest(
     const result = await client.query(insertQuery, values);
     const request = result.rows[0];
     
-    // Insert request-resource relationships
-    for (const resourceId of data.resource_ids) {
-      await client.query(
-        'INSERT INTO request_resources (request_id, resource_id) VALUES ($1, $2)',
-        [request.id, resourceId]
-      );
-    }
+    // Insert request-resource relationships in one statement
+    await client.query(
+      `INSERT INTO request_resources (request_id, resource_id)
+       SELECT $1, unnest($2::int[])`,
+      [request.id, resourceIds]
+    );
     
-    // Log audit entry
-    await logAudit({
+    // Collect audit entries and write them together
+    const auditEntries: AuditLogInput[] = [{
       request_id: request.id,
       action: 'booking_created',
       actor: data.created_by || 'system',
       new_status: request.status,
-      metadata: { request_id: requestId, resource_ids: data.resource_ids }
-    }, client);
+      metadata: { request_id: requestId, resource_ids: resourceIds }
+    }];
     
     // If auto-approved, log approval
     if (roWhitelisted) {
@@ -116,15 +128,17 @@ export async function createBookingRequest(
         [request.id, 'approve', 'system', 'Auto-approved: RO whitelisted']
       );
       
-      await logAudit({
+      auditEntries.push({
         request_id: request.id,
         action: 'auto_approved',
         actor: 'system',
         new_status: 'approved',
         reason: 'RO whitelisted'
-      }, client);
+      });
     }
     
+    await logAuditBatch(auditEntries, client);
+    
     await client.query('COMMIT');
     
     return request;
@@ -136,27 +150,32 @@ export async function createBookingRequest(
   }
 }
 
+// Booking row with its resources aggregated (callers add WHERE and GROUP BY r.id)
+const BOOKING_DETAIL_SELECT = `
+  SELECT r.*, 
+         COALESCE(
+           json_agg(
+             json_build_object(
+               'id', res.id,
+               'name', res.name,
+               'type', res.type,
+               'description', res.description,
+               'capacity', res.capacity,
+               'is_active', res.is_active
+             )
+           ) FILTER (WHERE res.id IS NOT NULL),
+           '[]'
+         ) as resources
+  FROM requests r
+  LEFT JOIN request_resources rr ON r.id = rr.request_id
+  LEFT JOIN resources res ON rr.resource_id = res.id
+`;
+
 // Get booking by ID or request_id
 export async function getBookingById(id: number | string): Promise<BookingDetail | null> {
   const isNumeric = typeof id === 'number' || !isNaN(Number(id));
   const query = `
-    SELECT r.*, 
-           COALESCE(
-             json_agg(
-               json_build_object(
-                 'id', res.id,
-                 'name', res.name,
-                 'type', res.type,
-                 'description', res.description,
-                 'capacity', res.capacity,
-                 'is_active', res.is_active
-               )
-             ) FILTER (WHERE res.id IS NOT NULL),
-             '[]'
-           ) as resources
-    FROM requests r
-    LEFT JOIN request_resources rr ON r.id = rr.request_id
-    LEFT JOIN resources res ON rr.resource_id = res.id
+    ${BOOKING_DETAIL_SELECT}
     WHERE ${isNumeric ? 'r.id = $1' : 'r.request_id = $1'}
     GROUP BY r.id
   `;
@@ -171,6 +190,95 @@ export async function getBookingById(id: number | string): Promise<BookingDetail
   return booking;
 }
 
+// Get several bookings by ID in one query, returned in the order of the given IDs
+export async function getBookingsByIds(ids: number[]): Promise<BookingDetail[]> {
+  if (ids.length === 0) {
+    return [];
+  }
+  
+  const result = await pool.query(
+    `${BOOKING_DETAIL_SELECT}
+     WHERE r.id = ANY($1::int[])
+     GROUP BY r.id`,
+    [ids]
+  );
+  
+  const byId = new Map<number, BookingDetail>();
+  for (const booking of result.rows) {
+    byId.set(booking.id, booking);
+  }
+  
+  const bookings: BookingDetail[] = [];
+  for (const id of ids) {
+    const booking = byId.get(id);
+    if (booking) {
+      bookings.push(booking);
+    }
+  }
+  return bookings;
+}
+
+// Conflict queries run as named prepared statements: Postgres parses and plans them
+// once per connection, so their text must not vary (excluded id is passed as NULL)
+const HAS_CONFLICTS_QUERY = `
+  SELECT EXISTS (
+    SELECT 1
+    FROM requests r
+    JOIN request_resources rr ON r.id = rr.request_id
+    WHERE r.status IN ('approved', 'pending')
+      AND rr.resource_id = ANY($1::int[])
+      AND tstzrange(r.start_timestamp, r.end_timestamp, '[)') && tstzrange($2, $3, '[)')
+      AND ($4::int IS NULL OR r.id != $4)
+  ) AS has_conflicts
+`;
+
+// Columns match ConflictInfo so rows can be returned without re-mapping
+const CONFLICT_ROWS_QUERY = `
+  SELECT 
+    r.request_id, r.group_name, r.ro_name,
+    r.start_timestamp, r.end_timestamp,
+    res.id as resource_id, res.name as resource_name
+  FROM requests r
+  JOIN request_resources rr ON r.id = rr.request_id
+  JOIN resources res ON rr.resource_id = res.id
+  WHERE r.status IN ('approved', 'pending')
+    AND rr.resource_id = ANY($1::int[])
+    AND tstzrange(r.start_timestamp, r.end_timestamp, '[)') && tstzrange($2, $3, '[)')
+    AND ($4::int IS NULL OR r.id != $4)
+  ORDER BY r.start_timestamp
+`;
+
+// Check whether any conflict exists (stops at the first overlapping booking)
+export async function hasConflicts(
+  startTimestamp: Date,
+  endTimestamp: Date,
+  resourceIds: number[],
+  excludeRequestId?: number
+): Promise<boolean> {
+  const result = await pool.query({
+    name: 'has-conflicts',
+    text: HAS_CONFLICTS_QUERY,
+    values: [resourceIds, startTimestamp, endTimestamp, excludeRequestId ?? null]
+  });
+  return result.rows[0].has_conflicts;
+}
+
+// Load conflicting bookings (one row per shared resource) overlapping a time window
+// Overlap is matched against idx_requests_active_time_range (half-open ranges)
+async function findConflictRows(
+  startTimestamp: Date,
+  endTimestamp: Date,
+  resourceIds: number[],
+  excludeRequestId?: number
+): Promise<ConflictInfo[]> {
+  const result = await pool.query({
+    name: 'find-conflict-rows',
+    text: CONFLICT_ROWS_QUERY,
+    values: [resourceIds, startTimestamp, endTimestamp, excludeRequestId ?? null]
+  });
+  return result.rows;
+}
+
 // Check for conflicts with existing bookings
 export async function checkConflicts(
   startTimestamp: Date,
@@ -178,40 +286,12 @@ export async function checkConflicts(
   resourceIds: number[],
   excludeRequestId?: number
 ): Promise<ConflictCheckResult> {
-  const query = `
-    SELECT 
-      r.id, r.request_id, r.group_name, r.ro_name,
-      r.start_timestamp, r.end_timestamp,
-      res.id as resource_id, res.name as resource_name
-    FROM requests r
-    JOIN request_resources rr ON r.id = rr.request_id
-    JOIN resources res ON rr.resource_id = res.id
-    WHERE r.status IN ('approved', 'pending')
-      AND rr.resource_id = ANY($1::int[])
-      AND (
-        (r.start_timestamp < $3 AND r.end_timestamp > $2)
-        OR (r.start_timestamp >= $2 AND r.start_timestamp < $3)
-        OR (r.end_timestamp > $2 AND r.end_timestamp <= $3)
-      )
-      ${excludeRequestId ? 'AND r.id != $4' : ''}
-    ORDER BY r.start_timestamp
-  `;
-  
-  const params = excludeRequestId 
-    ? [resourceIds, startTimestamp, endTimestamp, excludeRequestId]
-    : [resourceIds, startTimestamp, endTimestamp];
-  
-  const result = await pool.query(query, params);
-  
-  const conflicts: ConflictInfo[] = result.rows.map(row => ({
-    request_id: row.request_id,
-    resource_id: row.resource_id,
-    resource_name: row.resource_name,
-    start_timestamp: row.start_timestamp,
-    end_timestamp: row.end_timestamp,
-    group_name: row.group_name,
-    ro_name: row.ro_name
-  }));
+  const conflicts = await findConflictRows(
+    startTimestamp,
+    endTimestamp,
+    resourceIds,
+    excludeRequestId
+  );
   
   // Get nearby bookings for context (within same day)
   const dayStart = new Date(startTimestamp);
@@ -219,8 +299,9 @@ export async function checkConflicts(
   const dayEnd = new Date(startTimestamp);
   dayEnd.setHours(23, 59, 59, 999);
   
+  // Only ids are needed here; full details are loaded below
   const nearbyQuery = `
-    SELECT DISTINCT r.*
+    SELECT DISTINCT r.id, r.start_timestamp
     FROM requests r
     JOIN request_resources rr ON r.id = rr.request_id
     WHERE r.status IN ('approved', 'pending')
@@ -239,17 +320,58 @@ export async function checkConflicts(
   const nearbyResult = await pool.query(nearbyQuery, nearbyParams);
   
   // Fetch full details for nearby bookings
-  const nearbyBookings: BookingDetail[] = await Promise.all(
-    nearbyResult.rows.map(row => getBookingById(row.id) as Promise<BookingDetail>)
-  );
+  const nearbyBookings = await getBookingsByIds(nearbyResult.rows.map(row => row.id));
   
   return {
     has_conflicts: conflicts.length > 0,
     conflicts,
-    nearby_bookings: nearbyBookings.filter(b => b !== null)
+    nearby_bookings: nearbyBookings
   };
 }
 
+// Find all overlapping active bookings in a window (e.g., after importing a schedule)
+export async function findOverlappingBookings(
+  fromDate: Date,
+  toDate: Date
+): Promise<BookingOverlap[]> {
+  const result = await pool.query(
+    `SELECT 
+       r.request_id, r.group_name, r.ro_name,
+       r.start_timestamp, r.end_timestamp,
+       res.id as resource_id, res.name as resource_name
+     FROM requests r
+     JOIN request_resources rr ON r.id = rr.request_id
+     JOIN resources res ON rr.resource_id = res.id
+     WHERE r.status IN ('approved', 'pending')
+       AND tstzrange(r.start_timestamp, r.end_timestamp, '[)') && tstzrange($1, $2, '[)')`,
+    [fromDate, toDate]
+  );
+  
+  // Group by resource, then sweep each resource's bookings once
+  const byResource = new Map<number, Interval<ConflictInfo>[]>();
+  for (const row of result.rows as ConflictInfo[]) {
+    let intervals = byResource.get(row.resource_id);
+    if (!intervals) {
+      intervals = [];
+      byResource.set(row.resource_id, intervals);
+    }
+    intervals.push({ start: row.start_timestamp, end: row.end_timestamp, value: row });
+  }
+  
+  const overlaps: BookingOverlap[] = [];
+  for (const [resourceId, intervals] of byResource) {
+    for (const [first, second] of findOverlaps(intervals)) {
+      overlaps.push({
+        resource_id: resourceId,
+        resource_name: first.resource_name,
+        bookings: [first, second]
+      });
+    }
+  }
+  
+  return overlaps;
+}
+
 // Approve a booking (normal - blocked on conflicts)
 export async function approveBooking(
   requestId: number | string,
@@ -264,18 +386,17 @@ export async function approveBooking(
     throw new Error(`Cannot approve booking with status: ${booking.status}`);
   }
   
-  // Check for conflicts
+  // Check for conflicts (conflict rows are only loaded when reporting a failure)
   const resourceIds = booking.resources.map(r => r.id);
-  const conflictCheck = await checkConflicts(
-    booking.start_timestamp,
-    booking.end_timestamp,
-    resourceIds,
-    booking.id
-  );
-  
-  if (conflictCheck.has_conflicts) {
+  if (await hasConflicts(booking.start_timestamp, booking.end_timestamp, resourceIds, booking.id)) {
+    const conflicts = await findConflictRows(
+      booking.start_timestamp,
+      booking.end_timestamp,
+      resourceIds,
+      booking.id
+    );
     throw new Error(
-      `Cannot approve: conflicts detected with ${conflictCheck.conflicts.length} booking(s). ` +
+      `Cannot approve: conflicts detected with ${conflicts.length} booking(s). ` +
       `Use override approval if you want to proceed.`
     );
   }
@@ -502,34 +623,29 @@ export async function overrideAndBumpBooking(
     await client.query('BEGIN');
     
     // Mark all conflicting bookings as bumped
+    // Only approved bookings actually transition, so only those rows are returned
     const conflictingIds = [...new Set(conflictCheck.conflicts.map(c => c.request_id))];
-    const bumpedBookings = [];
-    
-    for (const conflictRequestId of conflictingIds) {
-      const conflictBooking = await getBookingById(conflictRequestId);
-      if (conflictBooking && conflictBooking.status === 'approved') {
-        // Update status to bumped
-        await client.query(
-          'UPDATE requests SET status = $1, updated_at = NOW() WHERE request_id = $2',
-          ['bumped', conflictRequestId]
-        );
-        
-        // Log audit for bumped booking
-        await logAudit({
-          request_id: conflictBooking.id,
-          action: 'bumped',
-          actor: input.actor,
-          old_status: 'approved',
-          new_status: 'bumped',
-          reason: `Bumped by ${booking.request_id}: ${input.override_reason}`,
-          metadata: { bumped_by: booking.request_id },
-          ip_address: input.ip_address,
-          user_agent: input.user_agent
-        }, client);
-        
-        bumpedBookings.push(conflictBooking);
-      }
-    }
+    const bumpedResult = await client.query(
+      `UPDATE requests SET status = 'bumped', updated_at = NOW()
+       WHERE request_id = ANY($1::varchar[]) AND status = 'approved'
+       RETURNING id, request_id, calendar_event_ids`,
+      [conflictingIds]
+    );
+    const bumpedBookings: Pick<BookingRequest, 'id' | 'request_id' | 'calendar_event_ids'>[] =
+      bumpedResult.rows;
+    
+    // Audit for bumped bookings (written with the approval entry below)
+    const auditEntries: AuditLogInput[] = bumpedBookings.map((bumped): AuditLogInput => ({
+      request_id: bumped.id,
+      action: 'bumped',
+      actor: input.actor,
+      old_status: 'approved',
+      new_status: 'bumped',
+      reason: `Bumped by ${booking.request_id}: ${input.override_reason}`,
+      metadata: { bumped_by: booking.request_id },
+      ip_address: input.ip_address,
+      user_agent: input.user_agent
+    }));
     
     // Update booking status to approved
     await client.query(
@@ -552,8 +668,8 @@ export async function overrideAndBumpBooking(
       ]
     );
     
-    // Log audit
-    await logAudit({
+    // Log audit for the bumps and the override in one insert
+    auditEntries.push({
       request_id: booking.id,
       action: 'override_and_bump',
       actor: input.actor,
@@ -566,7 +682,8 @@ export async function overrideAndBumpBooking(
       },
       ip_address: input.ip_address,
       user_agent: input.user_agent
-    }, client);
+    });
+    await logAuditBatch(auditEntries, client);
     
     await client.query('COMMIT');
     
@@ -610,34 +727,28 @@ export async function rescheduleBooking(
   }
   
   // Parse new time
-  const timezone = process.env.TIMEZONE || 'America/New_York';
-  const newStartTimestamp = combineDateTime(
+  const { start: newStartTimestamp, end: newEndTimestamp } = combineDateTimeRange(
     rescheduleInput.new_date,
     rescheduleInput.new_start_time,
-    timezone
-  );
-  const newEndTimestamp = combineDateTime(
-    rescheduleInput.new_date,
     rescheduleInput.new_end_time,
-    timezone
+    TIMEZONE
   );
   
-  if (newEndTimestamp <= newStartTimestamp) {
+  if (newEndTimestamp.getTime() <= newStartTimestamp.getTime()) {
     throw new Error('New end time must be after new start time');
   }
   
-  // Check conflicts for new time
+  // Check conflicts for new time (conflict rows are only loaded when reporting a failure)
   const resourceIds = booking.resources.map(r => r.id);
-  const conflictCheck = await checkConflicts(
-    newStartTimestamp,
-    newEndTimestamp,
-    resourceIds,
-    booking.id
-  );
-  
-  if (conflictCheck.has_conflicts) {
+  if (await hasConflicts(newStartTimestamp, newEndTimestamp, resourceIds, booking.id)) {
+    const conflicts = await findConflictRows(
+      newStartTimestamp,
+      newEndTimestamp,
+      resourceIds,
+      booking.id
+    );
     throw new Error(
-      `Cannot reschedule: conflicts detected at new time with ${conflictCheck.conflicts.length} booking(s)`
+      `Cannot reschedule: conflicts detected at new time with ${conflicts.length} booking(s)`
     );
   }
   
@@ -729,10 +840,10 @@ export async function listBookings(filters?: {
   limit?: number;
   offset?: number;
 }): Promise<BookingDetail[]> {
+  // Only ids are needed here; full details are loaded below
   let query = `
-    SELECT DISTINCT r.*
+    SELECT r.id
     FROM requests r
-    LEFT JOIN request_resources rr ON r.id = rr.request_id
     WHERE 1=1
   `;
   
@@ -757,8 +868,12 @@ export async function listBookings(filters?: {
     paramIndex++;
   }
   
+  // Semi-join on the resource index instead of joining every resource row and de-duplicating
   if (filters?.resource_id) {
-    query += ` AND rr.resource_id = $${paramIndex}`;
+    query += ` AND EXISTS (
+      SELECT 1 FROM request_resources rr
+      WHERE rr.request_id = r.id AND rr.resource_id = $${paramIndex}
+    )`;
     params.push(filters.resource_id);
     paramIndex++;
   }
@@ -779,12 +894,28 @@ export async function listBookings(filters?: {
   
   const result = await pool.query(query, params);
   
-  // Fetch full details for each booking
-  const bookings = await Promise.all(
-    result.rows.map(row => getBookingById(row.id) as Promise<BookingDetail>)
+  // Fetch full details for all bookings in one query
+  return getBookingsByIds(result.rows.map(row => row.id));
+}
+
+// Count bookings per status (served by idx_requests_status_start)
+export async function getBookingStatusCounts(): Promise<Record<BookingStatus, number>> {
+  const result = await pool.query(
+    'SELECT status, COUNT(*)::int AS count FROM requests GROUP BY status'
   );
   
-  return bookings.filter(b => b !== null);
+  const counts: Record<BookingStatus, number> = {
+    pending: 0,
+    approved: 0,
+    denied: 0,
+    bumped: 0,
+    rescheduled: 0
+  };
+  for (const row of result.rows) {
+    counts[row.status as BookingStatus] = row.count;
+  }
+  
+  return counts;
 }
 
 // Get suggested time slots
@@ -800,37 +931,45 @@ export async function getSuggestedTimeSlots(
   const duration = booking.end_timestamp.getTime() - booking.start_timestamp.getTime();
   const resourceIds = booking.resources.map(r => r.id);
   
-  const suggestions: TimeSlotSuggestion[] = [];
-  const timezone = process.env.TIMEZONE || 'America/New_York';
-  
-  // Check same time slot for next several days
+  // Same time slot for next several days
+  const slots: Array<{ date: string; start: Date; end: Date }> = [];
   for (let i = 1; i <= daysAhead; i++) {
     const newDate = new Date(booking.requested_date);
     newDate.setDate(newDate.getDate() + i);
+    const date = newDate.toISOString().slice(0, 10); // YYYY-MM-DD
     
-    const newStartTimestamp = combineDateTime(
-      newDate.toISOString().split('T')[0],
-      booking.start_time,
-      timezone
-    );
-    const newEndTimestamp = new Date(newStartTimestamp.getTime() + duration);
-    
-    const conflictCheck = await checkConflicts(
-      newStartTimestamp,
-      newEndTimestamp,
-      resourceIds
+    const start = combineDateTime(date, booking.start_time, TIMEZONE);
+    slots.push({ date, start, end: new Date(start.getTime() + duration) });
+  }
+  
+  if (slots.length === 0) {
+    return [];
+  }
+  
+  // Load every conflict across the whole window once, then test each slot in memory
+  const windowConflicts = await findConflictRows(
+    slots[0].start,
+    slots[slots.length - 1].end,
+    resourceIds
+  );
+  
+  const suggestions: TimeSlotSuggestion[] = slots.map(slot => {
+    const slotStart = slot.start.getTime();
+    const slotEnd = slot.end.getTime();
+    const conflicts = windowConflicts.filter(c =>
+      c.start_timestamp.getTime() < slotEnd && c.end_timestamp.getTime() > slotStart
     );
     
-    suggestions.push({
-      date: newDate.toISOString().split('T')[0],
+    return {
+      date: slot.date,
       start_time: booking.start_time,
       end_time: booking.end_time,
-      start_timestamp: newStartTimestamp,
-      end_timestamp: newEndTimestamp,
-      available: !conflictCheck.has_conflicts,
-      conflicts: conflictCheck.conflicts
-    });
-  }
+      start_timestamp: slot.start,
+      end_timestamp: slot.end,
+      available: conflicts.length === 0,
+      conflicts
+    };
+  });
   
   return suggestions;
 }
@@ -11,6 +11,9 @@ const __dirname = path.dirname(__filename);
 // Check if Google Calendar is enabled
 const CALENDAR_ENABLED = process.env.GOOGLE_CALENDAR_ENABLED === 'true';
 
+// Timezone for calendar events
+const TIMEZONE = process.env.TIMEZONE || 'America/New_York';
+
 // Initialize Google Calendar API client
 let calendar: any = null;
 
@@ -53,14 +56,20 @@ async function getCalendar() {
   return calendar;
 }
 
-// Get resource calendar mapping
-async function getResourceCalendarId(resourceId: number): Promise<string | null> {
+// Get resource calendar mappings for several resources in one query
+async function getResourceCalendarIds(resourceIds: number[]): Promise<Map<number, string>> {
   const result = await pool.query(
-    'SELECT calendar_id FROM resource_calendars WHERE resource_id = $1',
-    [resourceId]
+    'SELECT resource_id, calendar_id FROM resource_calendars WHERE resource_id = ANY($1::int[])',
+    [resourceIds]
   );
   
-  return result.rows[0]?.calendar_id || null;
+  const calendarIds = new Map<number, string>();
+  for (const row of result.rows) {
+    if (!calendarIds.has(row.resource_id)) {
+      calendarIds.set(row.resource_id, row.calendar_id);
+    }
+  }
+  return calendarIds;
 }
 
 // Format booking for calendar event
@@ -83,11 +92,11 @@ Status: ${booking.status}
     description,
     start: {
       dateTime: booking.start_timestamp.toISOString(),
-      timeZone: process.env.TIMEZONE || 'America/New_York',
+      timeZone: TIMEZONE,
     },
     end: {
       dateTime: booking.end_timestamp.toISOString(),
-      timeZone: process.env.TIMEZONE || 'America/New_York',
+      timeZone: TIMEZONE,
     },
     attendees: [
       { email: booking.contact_email }
@@ -112,11 +121,12 @@ export async function createCalendarEvents(booking: BookingDetail): Promise<Cale
 
   const eventRefs: CalendarEventRef[] = [];
   const event = formatCalendarEvent(booking);
+  const calendarIds = await getResourceCalendarIds(booking.resources.map(r => r.id));
 
   // Create event in each resource's calendar
   for (const resource of booking.resources) {
     try {
-      const calendarId = await getResourceCalendarId(resource.id);
+      const calendarId = calendarIds.get(resource.id);
       
       if (!calendarId) {
         console.warn(`No calendar mapping found for resource ${resource.name} (ID: ${resource.id})`);
@@ -142,6 +142,13 @@ export interface ConflictInfo {
   ro_name: string;
 }
 
+// Pair of active bookings that overlap on the same resource
+export interface BookingOverlap {
+  resource_id: number;
+  resource_name: string;
+  bookings: [ConflictInfo, ConflictInfo];
+}
+
 // Reschedule record
 export interface Reschedule {
   id: number;
@@ -0,0 +1,41 @@
+import { findOverlaps } from './intervals';
+import type { Interval } from './intervals';
+
+// Build intervals on a fixed day from HH:MM times
+const at = (time: string) => new Date(`2024-03-15T${time}:00Z`);
+const slot = (value: string, start: string, end: string): Interval<string> => ({
+  start: at(start),
+  end: at(end),
+  value,
+});
+
+describe('Interval Utils', () => {
+  describe('findOverlaps', () => {
+    it('should report overlapping pairs in start order', () => {
+      const overlaps = findOverlaps([
+        slot('C', '13:00', '15:00'),
+        slot('A', '09:00', '12:00'),
+        slot('B', '11:00', '14:00'),
+      ]);
+      expect(overlaps).toEqual([['A', 'B'], ['B', 'C']]);
+    });
+
+    it('should not report adjacent or disjoint intervals', () => {
+      const overlaps = findOverlaps([
+        slot('A', '09:00', '12:00'),
+        slot('B', '12:00', '15:00'),
+        slot('C', '16:00', '17:00'),
+      ]);
+      expect(overlaps).toEqual([]);
+    });
+
+    it('should report every pair for nested intervals', () => {
+      const overlaps = findOverlaps([
+        slot('A', '09:00', '17:00'),
+        slot('B', '10:00', '11:00'),
+        slot('C', '10:30', '12:00'),
+      ]);
+      expect(overlaps).toEqual([['A', 'B'], ['A', 'C'], ['B', 'C']]);
+    });
+  });
+});
@@ -0,0 +1,36 @@
+// Interval utilities for bulk overlap detection
+
+export interface Interval<T> {
+  start: Date;
+  end: Date;
+  value: T;
+}
+
+// Find every overlapping pair with a sweep over intervals sorted by start.
+// Intervals are half-open, so one ending exactly when another starts does not overlap.
+// Runs in O(n log n + k) for n intervals and k reported pairs.
+export function findOverlaps<T>(intervals: Interval<T>[]): Array<[T, T]> {
+  // Precompute numeric keys once so sorting and sweeping compare plain numbers
+  const keyed = intervals.map(({ start, end, value }) => ({
+    start: start.getTime(),
+    end: end.getTime(),
+    value
+  }));
+  keyed.sort((a, b) => a.start - b.start);
+  
+  const overlaps: Array<[T, T]> = [];
+  let active: typeof keyed = [];
+  
+  for (const interval of keyed) {
+    // Drop intervals that ended before this one starts; the rest all overlap it
+    active = active.filter(other => other.end > interval.start);
+    
+    for (const other of active) {
+      overlaps.push([other.value, interval.value]);
+    }
+    
+    active.push(interval);
+  }
+  
+  return overlaps;
+}
@@ -1,39 +1,60 @@
-import { parseTime, combineDateTime, formatDate, formatTime } from './time';
+import { parseTime, combineDateTime, combineDateTimeRange, formatDate, formatTime } from './time';
+
+// Fixed reference date so results never depend on the wall clock
+const REFERENCE_DATE = '2024-03-15';
 
 describe('Time Utils', () => {
   describe('parseTime', () => {
-    it('should parse valid time strings with two-digit hours', () => {
-      expect(parseTime('09:00')).toEqual({ hours: 9, minutes: 0 });
-      expect(parseTime('14:30')).toEqual({ hours: 14, minutes: 30 });
-      expect(parseTime('23:59')).toEqual({ hours: 23, minutes: 59 });
+    it.each([
+      ['09:00', { hours: 9, minutes: 0 }],
+      ['14:30', { hours: 14, minutes: 30 }],
+      ['23:59', { hours: 23, minutes: 59 }],
+    ])('should parse valid time string %s', (input, expected) => {
+      expect(parseTime(input)).toEqual(expected);
     });
 
-    it('should throw error for invalid time format', () => {
-      expect(() => parseTime('25:00')).toThrow('Invalid time values');
-      expect(() => parseTime('14:60')).toThrow('Invalid time values');
-      expect(() => parseTime('invalid')).toThrow('Invalid time format');
+    it.each([
+      ['25:00', 'Invalid time values'],
+      ['14:60', 'Invalid time values'],
+      ['invalid', 'Invalid time format'],
+      ['9:00', 'Invalid time format'],
+    ])('should throw error for invalid time string %s', (input, message) => {
+      expect(() => parseTime(input)).toThrow(message);
     });
   });
 
   describe('combineDateTime', () => {
     it('should combine date and time correctly', () => {
-      const result = combineDateTime('2024-03-15', '09:00', 'America/New_York');
+      const result = combineDateTime(REFERENCE_DATE, '09:00', 'America/New_York');
       expect(result).toBeInstanceOf(Date);
       expect(result.getUTCHours()).toBeGreaterThanOrEqual(0);
     });
 
     it('should handle different timezones', () => {
-      const nyTime = combineDateTime('2024-03-15', '09:00', 'America/New_York');
-      const laTime = combineDateTime('2024-03-15', '09:00', 'America/Los_Angeles');
+      const nyTime = combineDateTime(REFERENCE_DATE, '09:00', 'America/New_York');
+      const laTime = combineDateTime(REFERENCE_DATE, '09:00', 'America/Los_Angeles');
       
       // LA is 3 hours behind NY, so LA 9am should be later in UTC
       expect(laTime.getTime()).toBeGreaterThan(nyTime.getTime());
     });
   });
 
+  describe('combineDateTimeRange', () => {
+    it('should match combineDateTime for start and end', () => {
+      const range = combineDateTimeRange(REFERENCE_DATE, '09:00', '12:00', 'America/New_York');
+      expect(range.start).toEqual(combineDateTime(REFERENCE_DATE, '09:00', 'America/New_York'));
+      expect(range.end).toEqual(combineDateTime(REFERENCE_DATE, '12:00', 'America/New_York'));
+    });
+
+    it('should throw error for invalid input', () => {
+      expect(() => combineDateTimeRange(REFERENCE_DATE, '09:00', '24:00')).toThrow('Invalid time values');
+      expect(() => combineDateTimeRange('not-a-date', '09:00', '12:00')).toThrow('Invalid date');
+    });
+  });
+
   describe('formatDate', () => {
     it('should format date correctly', () => {
-      const date = new Date('2024-03-15T12:00:00Z');
+      const date = new Date(`${REFERENCE_DATE}T12:00:00Z`);
       const formatted = formatDate(date);
       expect(formatted).toMatch(/^\d{4}-\d{2}-\d{2}$/);
     });
@@ -41,7 +62,7 @@ describe('Time Utils', () => {
 
   describe('formatTime', () => {
     it('should format time in HH:MM format', () => {
-      const date = new Date('2024-03-15T09:30:00Z');
+      const date = new Date(`${REFERENCE_DATE}T09:30:00Z`);
       const formatted = formatTime(date);
       expect(formatted).toMatch(/^\d{2}:\d{2}$/);
     });
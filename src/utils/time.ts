@@ -23,14 +23,45 @@ export function combineDateTime(
   timeStr: string,
   timezone: string = 'America/New_York'
 ): Date {
-  const { hours, minutes } = parseTime(timeStr);
+  const time = parseTime(timeStr);
+  const date = parseDate(dateStr);
   
-  // Parse date
+  return toTimestamp(date, time, getTimezoneOffset(timezone));
+}
+
+// Combine one date with a start and end time, parsing the date and timezone only once
+export function combineDateTimeRange(
+  dateStr: string,
+  startTimeStr: string,
+  endTimeStr: string,
+  timezone: string = 'America/New_York'
+): { start: Date; end: Date } {
+  const startTime = parseTime(startTimeStr);
+  const endTime = parseTime(endTimeStr);
+  const date = parseDate(dateStr);
+  const offset = getTimezoneOffset(timezone);
+  
+  return {
+    start: toTimestamp(date, startTime, offset),
+    end: toTimestamp(date, endTime, offset)
+  };
+}
+
+// Parse date string, rejecting invalid dates
+function parseDate(dateStr: string): Date {
   const date = new Date(dateStr);
   if (isNaN(date.getTime())) {
     throw new Error(`Invalid date: ${dateStr}`);
   }
-  
+  return date;
+}
+
+// Build a timestamp from a parsed date and time, adjusted by a timezone offset in minutes
+function toTimestamp(
+  date: Date,
+  { hours, minutes }: { hours: number; minutes: number },
+  offset: number
+): Date {
   // Create a date string in the local timezone
   // Format: YYYY-MM-DDTHH:MM:SS
   const year = date.getFullYear();
@@ -48,32 +79,28 @@ export function combineDateTime(
   // Create date in local time (browser/system timezone)
   const localDate = new Date(localDateTimeStr);
   
-  // Get timezone offset for the configured timezone
+  // Adjust for timezone
   // Note: This is simplified. In production, use a library like date-fns-tz or luxon
   // that properly handles DST and timezone conversions
-  const offset = getTimezoneOffset(timezone);
-  
-  // Adjust for timezone
-  const utcDate = new Date(localDate.getTime() - offset * 60000);
-  
-  return utcDate;
+  return new Date(localDate.getTime() - offset * 60000);
 }
 
+// Timezone offsets in minutes (built once at module load)
+// This is a simplified mapping. Use a proper library in production.
+// These offsets are for standard time only and do NOT adjust for DST
+const TIMEZONE_OFFSETS: ReadonlyMap<string, number> = new Map([
+  ['America/New_York', -300], // EST (UTC-5) - Does NOT account for EDT (UTC-4)
+  ['America/Chicago', -360], // CST (UTC-6) - Does NOT account for CDT (UTC-5)
+  ['America/Denver', -420], // MST (UTC-7) - Does NOT account for MDT (UTC-6)
+  ['America/Los_Angeles', -480], // PST (UTC-8) - Does NOT account for PDT (UTC-7)
+  ['UTC', 0],
+]);
+
 // Get timezone offset in minutes (simplified - doesn't handle DST properly)
 // WARNING: This simplified implementation does NOT account for Daylight Saving Time
 // In production, use a proper timezone library like luxon or date-fns-tz
 function getTimezoneOffset(timezone: string): number {
-  // This is a simplified mapping. Use a proper library in production.
-  // These offsets are for standard time only and do NOT adjust for DST
-  const offsets: Record<string, number> = {
-    'America/New_York': -300, // EST (UTC-5) - Does NOT account for EDT (UTC-4)
-    'America/Chicago': -360, // CST (UTC-6) - Does NOT account for CDT (UTC-5)
-    'America/Denver': -420, // MST (UTC-7) - Does NOT account for MDT (UTC-6)
-    'America/Los_Angeles': -480, // PST (UTC-8) - Does NOT account for PDT (UTC-7)
-    'UTC': 0,
-  };
-  
-  return offsets[timezone] || 0;
+  return TIMEZONE_OFFSETS.get(timezone) ?? 0;
 }
 
 // Format timestamp for display in local timezone